@@ -25,6 +25,7 @@
 import sys
 import logging as log
 from threading import Thread, Event
+from collections import deque
 
 # import helper packages
 from .helper import (
@@ -37,6 +38,7 @@
     check_gstreamer_support,
     dimensions_to_resolutions,
     import_dependency_safe,
+    get_reusable_buffer,
 )
 
 # define logger
@@ -311,11 +313,17 @@ def __init__(
         if time_delay and isinstance(time_delay, (int, float)):
             time.sleep(time_delay)
 
+        # define pool of reusable buffers for decoding frames
+        self.__frame_pool = deque(maxlen=8)
+
         # frame variable initialization
         (grabbed, self.frame) = self.stream.read()
 
         # check if valid stream
         if grabbed:
+            # save decoded frame layout for reusable buffers
+            self.__frame_layout = (self.frame.shape, self.frame.dtype)
+
             # render colorspace if defined
             if not (self.color_space is None):
                 self.frame = cv2.cvtColor(self.frame, self.color_space)
@@ -366,8 +374,10 @@ def __update(self):
             # stream not read yet
             self.__stream_read.clear()
 
-            # otherwise, read the next frame from the stream
-            (grabbed, frame) = self.stream.read()
+            # otherwise, read the next frame from the stream into a reusable buffer
+            (grabbed, frame) = self.stream.read(
+                get_reusable_buffer(self.__frame_pool, *self.__frame_layout)
+            )
 
             # stream read completed
             self.__stream_read.set()
@@ -383,6 +393,9 @@ def __update(self):
                 else:
                     break
 
+            # update decoded frame layout, if changed
+            self.__frame_layout = (frame.shape, frame.dtype)
+
             # apply colorspace to frames if valid
             if not (self.color_space is None):
                 color_frame = None
@@ -37,6 +37,7 @@
 import socket
 from tqdm import tqdm
 from contextlib import closing
+from collections import deque
 from pathlib import Path
 from colorlog import ColoredFormatter
 from distutils.version import LooseVersion
@@ -890,6 +891,52 @@ def reducer(frame=None, percentage=0, interpolation=cv2.INTER_LANCZOS4):
     return cv2.resize(frame, dimensions, interpolation=interpolation)
 
 
+def get_refcounts(pool):
+    """
+    ## get_refcounts
+
+    Returns reference counts of all buffers in given pool.
+
+    Parameters:
+        pool (deque): pool of numpy buffers.
+
+    **Returns:** A list of integers.
+    """
+    return [sys.getrefcount(buffer) for buffer in pool]
+
+
+# reference count of a pooled buffer, that is not referenced anywhere outside its pool
+free_refcount = get_refcounts(deque([np.empty(0, dtype=np.uint8)]))[0]
+
+
+def get_reusable_buffer(pool, shape, dtype=np.uint8):
+    """
+    ## get_reusable_buffer
+
+    Returns a buffer of given shape and datatype from given pool, that is no longer referenced anywhere outside
+    it _(i.e. no frame or view of it is still in use)_, otherwise allocates a new one and appends it to the pool.
+
+    Parameters:
+        pool (deque): pool of numpy buffers _(oldest buffer is discarded if pool is full)_.
+        shape (tuple): shape of required buffer.
+        dtype (numpy.dtype): datatype of required buffer.
+
+    **Returns:** A n-dimensional numpy array.
+    """
+    # reuse free buffer of same layout from pool if available
+    for index, refcount in enumerate(get_refcounts(pool)):
+        if (
+            refcount <= free_refcount
+            and pool[index].shape == tuple(shape)
+            and pool[index].dtype == dtype
+        ):
+            return pool[index]
+    # otherwise allocate a new one
+    buffer = np.empty(shape, dtype=dtype)
+    pool.append(buffer)
+    return buffer
+
+
 def dict2Args(param_dict):
     """
     ## dict2Args
@@ -23,6 +23,7 @@
 import time
 import string
 import secrets
+import tempfile
 import numpy as np
 import logging as log
 from threading import Thread
@@ -36,6 +37,7 @@
     check_WriteAccess,
     check_open_port,
     import_dependency_safe,
+    get_reusable_buffer,
 )
 
 # safe import critical Class modules
@@ -178,6 +180,9 @@ def __init__(
         self.__msg_flag = 0  # handles connection flags
         self.__msg_copy = False  # handles whether to copy data
         self.__msg_track = False  # handles whether to track packets
+        self.__io_threads = 0  # handles I/O threads for dedicated messaging context
+        self.__msg_context = None  # handles user-defined messaging context
+        self.__socket_buffer_size = 0  # handles kernel socket buffers size (in bytes)
 
         # Handle NetGear's internal exclusive modes and params
 
@@ -212,6 +217,7 @@ def __init__(
         self.__jpeg_compression_quality = 90  # 90% quality
         self.__jpeg_compression_fastdct = True  # fastest DCT on by default
         self.__jpeg_compression_fastupsample = False  # fastupsample off by default
+        self.__jpeg_compression_colorsubsampling = "422"  # 4:2:2 subsampling by default
         self.__jpeg_compression_colorspace = "BGR"  # use BGR colorspace by default
 
         # defines frame compression on return data
@@ -372,6 +378,14 @@ def __init__(
             elif key == "jpeg_compression_fastupsample" and isinstance(value, bool):
                 # enable jpeg  fastupsample
                 self.__jpeg_compression_fastupsample = value
+            elif key == "jpeg_compression_colorsubsampling" and isinstance(value, str):
+                # set valid jpeg chroma subsampling
+                if value.strip() in ["444", "422", "420", "440", "411"]:
+                    self.__jpeg_compression_colorsubsampling = value.strip()
+                else:
+                    logger.warning(
+                        "Skipped invalid `jpeg_compression_colorsubsampling` value!"
+                    )
 
             # assign maximum retries in synchronous patterns
             elif key == "max_retries" and isinstance(value, int) and pattern < 2:
@@ -393,6 +407,18 @@ def __init__(
                 self.__msg_copy = value
             elif key == "track" and isinstance(value, bool):
                 self.__msg_track = value
+            elif key == "io_threads" and isinstance(value, int):
+                if value > 0:
+                    self.__io_threads = value
+                else:
+                    logger.warning("Invalid `io_threads` value skipped!")
+            elif key == "context" and isinstance(value, zmq.Context):
+                self.__msg_context = value
+            elif key == "socket_buffer_size" and isinstance(value, int):
+                if value > 0:
+                    self.__socket_buffer_size = value
+                else:
+                    logger.warning("Invalid `socket_buffer_size` value skipped!")
             else:
                 pass
 
@@ -515,8 +541,24 @@ def __init__(
                 )
             )
 
-        # define messaging context instance
-        self.__msg_context = zmq.Context.instance()
+        # check if user-defined messaging context is provided
+        if not (self.__msg_context is None):
+            if self.__io_threads:
+                # user-defined context is never replaced
+                self.__io_threads = 0
+                logger.warning(
+                    "Skipped `io_threads` value with user-defined `context`!"
+                )
+        else:
+            # otherwise define messaging context instance, with dedicated I/O threads if specified
+            self.__msg_context = (
+                zmq.Context(io_threads=self.__io_threads)
+                if self.__io_threads
+                else zmq.Context.instance()
+            )
+
+        # define secure mode authenticator handler
+        self.__z_auth = None
 
         # initialize and assign receive mode to global variable
         self.__receive_mode = receive_mode
@@ -526,7 +568,12 @@ def __init__(
 
             # define connection address
             if address is None:
-                address = "*"  # define address
+                # use common socket path for `ipc` protocol, otherwise all interfaces
+                address = (
+                    os.path.join(tempfile.gettempdir(), "netgear")
+                    if protocol == "ipc"
+                    else "*"
+                )
 
             # check if multiserver_mode is enabled
             if self.__multiserver_mode:
@@ -569,24 +616,24 @@ def __init__(
                 # activate secure_mode threaded authenticator
                 if self.__secure_mode > 0:
                     # start an authenticator for this context
-                    z_auth = ThreadAuthenticator(self.__msg_context)
-                    z_auth.start()
-                    z_auth.allow(str(address))  # allow current address
+                    self.__z_auth = ThreadAuthenticator(self.__msg_context)
+                    self.__z_auth.start()
+                    self.__z_auth.allow(str(address))  # allow current address
 
                     # check if `IronHouse` is activated
                     if self.__secure_mode == 2:
                         # tell authenticator to use the certificate from given valid dir
-                        z_auth.configure_curve(
+                        self.__z_auth.configure_curve(
                             domain="*", location=self.__auth_publickeys_dir
                         )
                     else:
                         # otherwise tell the authenticator how to handle the CURVE requests, if `StoneHouse` is activated
-                        z_auth.configure_curve(
+                        self.__z_auth.configure_curve(
                             domain="*", location=auth.CURVE_ALLOW_ANY
                         )
 
                 # define thread-safe messaging socket
-                self.__msg_socket = self.__msg_context.socket(msg_pattern[1])
+                self.__msg_socket = self.__create_socket(msg_pattern[1])
 
                 # define pub-sub flag
                 if self.__pattern == 2:
@@ -683,6 +730,9 @@ def __init__(
             # define deque and assign it to global var
             self.__queue = deque(maxlen=96)  # max len 96 to check overflow
 
+            # define pool of reusable output buffers for decoding JPEG frames
+            self.__decode_pool = deque(maxlen=8)
+
             # initialize and start threaded recv_handler
             self.__thread = Thread(target=self.__recv_handler, name="NetGear", args=())
             self.__thread.daemon = True
@@ -724,7 +774,12 @@ def __init__(
 
             # define connection address
             if address is None:
-                address = "localhost"
+                # use common socket path for `ipc` protocol, otherwise localhost
+                address = (
+                    os.path.join(tempfile.gettempdir(), "netgear")
+                    if protocol == "ipc"
+                    else "localhost"
+                )
 
             # check if multiserver_mode is enabled
             if self.__multiserver_mode:
@@ -767,24 +822,24 @@ def __init__(
                 # activate secure_mode threaded authenticator
                 if self.__secure_mode > 0:
                     # start an authenticator for this context
-                    z_auth = ThreadAuthenticator(self.__msg_context)
-                    z_auth.start()
-                    z_auth.allow(str(address))  # allow current address
+                    self.__z_auth = ThreadAuthenticator(self.__msg_context)
+                    self.__z_auth.start()
+                    self.__z_auth.allow(str(address))  # allow current address
 
                     # check if `IronHouse` is activated
                     if self.__secure_mode == 2:
                         # tell authenticator to use the certificate from given valid dir
-                        z_auth.configure_curve(
+                        self.__z_auth.configure_curve(
                             domain="*", location=self.__auth_publickeys_dir
                         )
                     else:
                         # otherwise tell the authenticator how to handle the CURVE requests, if `StoneHouse` is activated
-                        z_auth.configure_curve(
+                        self.__z_auth.configure_curve(
                             domain="*", location=auth.CURVE_ALLOW_ANY
                         )
 
                 # define thread-safe messaging socket
-                self.__msg_socket = self.__msg_context.socket(msg_pattern[0])
+                self.__msg_socket = self.__create_socket(msg_pattern[0])
 
                 # if req/rep pattern, define additional flags
                 if self.__pattern == 1:
@@ -928,6 +983,21 @@ def __init__(
                     "Send Mode is successfully activated and ready to send data."
                 )
 
+    def __create_socket(self, socket_type):
+        """
+        Creates a new messaging socket of given type, with kernel socket buffers size applied (if specified).
+
+        Parameters:
+            socket_type (int): ZMQ socket type.
+
+        **Returns:** A ZMQ socket.
+        """
+        socket = self.__msg_context.socket(socket_type)
+        if self.__socket_buffer_size:
+            socket.setsockopt(zmq.SNDBUF, self.__socket_buffer_size)
+            socket.setsockopt(zmq.RCVBUF, self.__socket_buffer_size)
+        return socket
+
     def __recv_handler(self):
 
         """
@@ -947,12 +1017,27 @@ def __recv_handler(self):
                 continue
 
             if self.__pattern < 2:
-                socks = dict(self.__poll.poll(self.__request_timeout * 3))
-                if socks.get(self.__msg_socket) == zmq.POLLIN:
+                msg_json = None
+                try:
+                    # fetch already arrived message directly, without polling socket
                     msg_json = self.__msg_socket.recv_json(
-                        flags=self.__msg_flag | zmq.DONTWAIT
+                        flags=self.__msg_flag | zmq.NOBLOCK
                     )
-                else:
+                except zmq.Again:
+                    # otherwise poll the socket until message arrives or timeout
+                    if self.__poll_socket(self.__request_timeout * 3):
+                        try:
+                            msg_json = self.__msg_socket.recv_json(
+                                flags=self.__msg_flag | zmq.DONTWAIT
+                            )
+                        except zmq.Again:
+                            # poller can report a spurious event (e.g. while secure handshake
+                            # completes), so keep waiting for actual message
+                            continue
+                    elif self.__terminate:
+                        # stop waiting, if terminated meanwhile
+                        break
+                if msg_json is None:
                     logger.critical("No response from Server(s), Reconnecting again...")
                     self.__msg_socket.close(linger=0)
                     self.__poll.unregister(self.__msg_socket)
@@ -968,9 +1053,7 @@ def __recv_handler(self):
 
                     # Create new connection
                     try:
-                        self.__msg_socket = self.__msg_context.socket(
-                            self.__msg_pattern
-                        )
+                        self.__msg_socket = self.__create_socket(self.__msg_pattern)
                         if isinstance(self.__connection_address, list):
                             for _connection in self.__connection_address:
                                 self.__msg_socket.bind(_connection)
@@ -1023,7 +1106,8 @@ def __recv_handler(self):
                     )
                 continue
 
-            msg_data = self.__msg_socket.recv(
+            # receive all frame(s) parts of the message
+            msg_frames = self.__msg_socket.recv_multipart(
                 flags=self.__msg_flag | zmq.DONTWAIT,
                 copy=self.__msg_copy,
                 track=self.__msg_track,
@@ -1063,7 +1147,7 @@ def __recv_handler(self):
                                     return_data,
                                     quality=self.__jpeg_compression_quality,
                                     colorspace=self.__jpeg_compression_colorspace,
-                                    colorsubsampling="422",
+                                    colorsubsampling=self.__jpeg_compression_colorsubsampling,
                                     fastdct=self.__jpeg_compression_fastdct,
                                 )
 
@@ -1123,53 +1207,128 @@ def __recv_handler(self):
                 if self.__return_data:
                     logger.warning("`return_data` is disabled for this pattern!")
 
-            # check if encoding was enabled
-            if msg_json["compression"]:
-                # decode JPEG frame
-                frame = simplejpeg.decode_jpeg(
-                    msg_data,
-                    colorspace=msg_json["compression"]["colorspace"],
-                    fastdct=self.__jpeg_compression_fastdct
-                    or msg_json["compression"]["dct"],
-                    fastupsample=self.__jpeg_compression_fastupsample
-                    or msg_json["compression"]["ups"],
-                )
-                # check if valid frame returned
-                if frame is None:
-                    self.__terminate = True
-                    # otherwise raise error and exit
-                    raise RuntimeError(
-                        "[NetGear:ERROR] :: Received compressed JPEG frame decoding failed"
-                    )
-                if msg_json["compression"]["colorspace"] == "GRAY" and frame.ndim == 3:
-                    # patch for https://gitlab.com/jfolz/simplejpeg/-/issues/11
-                    frame = np.squeeze(frame, axis=2)
+            # handle frame(s) datatype and shape
+            if msg_json.get("batch", False):
+                msg_dtypes, msg_shapes = msg_json["dtype"], msg_json["shape"]
             else:
-                # recover and reshape frame from buffer
-                frame_buffer = np.frombuffer(msg_data, dtype=msg_json["dtype"])
-                frame = frame_buffer.reshape(msg_json["shape"])
+                msg_dtypes, msg_shapes = [msg_json["dtype"]], [msg_json["shape"]]
 
-            # check if multiserver_mode
-            if self.__multiserver_mode:
-                # save the unique port addresses
-                if not msg_json["port"] in self.__port_buffer:
-                    self.__port_buffer.append(msg_json["port"])
-                # extract if any message from server and display it
-                if msg_json["message"]:
-                    self.__queue.append((msg_json["port"], msg_json["message"], frame))
+            # loop over received frame(s)
+            for msg_data, msg_dtype, msg_shape in zip(
+                msg_frames, msg_dtypes, msg_shapes
+            ):
+                # check if encoding was enabled
+                if msg_json["compression"]:
+                    # decode JPEG frame into a reusable buffer
+                    frame = simplejpeg.decode_jpeg(
+                        msg_data,
+                        colorspace=msg_json["compression"]["colorspace"],
+                        fastdct=self.__jpeg_compression_fastdct
+                        or msg_json["compression"]["dct"],
+                        fastupsample=self.__jpeg_compression_fastupsample
+                        or msg_json["compression"]["ups"],
+                        buffer=self.__get_decode_buffer(
+                            msg_data, msg_json["compression"]["colorspace"]
+                        ),
+                    )
+                    # check if valid frame returned
+                    if frame is None:
+                        self.__terminate = True
+                        # otherwise raise error and exit
+                        raise RuntimeError(
+                            "[NetGear:ERROR] :: Received compressed JPEG frame decoding failed"
+                        )
+                    if (
+                        msg_json["compression"]["colorspace"] == "GRAY"
+                        and frame.ndim == 3
+                    ):
+                        # patch for https://gitlab.com/jfolz/simplejpeg/-/issues/11
+                        frame = np.squeeze(frame, axis=2)
                 else:
-                    # append recovered unique port and frame to queue
-                    self.__queue.append((msg_json["port"], frame))
-            # extract if any message from server if Bidirectional Mode is enabled
-            elif self.__bi_mode:
-                if msg_json["message"]:
-                    # append grouped frame and data to queue
-                    self.__queue.append((msg_json["message"], frame))
+                    # recover and reshape frame from buffer
+                    frame_buffer = np.frombuffer(msg_data, dtype=msg_dtype)
+                    frame = frame_buffer.reshape(msg_shape)
+
+                # wait for queue buffer to free up, before appending batched frames
+                while len(self.__queue) >= 96 and not self.__terminate:
+                    time.sleep(0.000001)
+
+                # check if multiserver_mode
+                if self.__multiserver_mode:
+                    # save the unique port addresses
+                    if not msg_json["port"] in self.__port_buffer:
+                        self.__port_buffer.append(msg_json["port"])
+                    # extract if any message from server and display it
+                    if msg_json["message"]:
+                        self.__queue.append(
+                            (msg_json["port"], msg_json["message"], frame)
+                        )
+                    else:
+                        # append recovered unique port and frame to queue
+                        self.__queue.append((msg_json["port"], frame))
+                # extract if any message from server if Bidirectional Mode is enabled
+                elif self.__bi_mode:
+                    if msg_json["message"]:
+                        # append grouped frame and data to queue
+                        self.__queue.append((msg_json["message"], frame))
+                    else:
+                        self.__queue.append((None, frame))
                 else:
-                    self.__queue.append((None, frame))
-            else:
-                # otherwise append recovered frame to queue
-                self.__queue.append(frame)
+                    # otherwise append recovered frame to queue
+                    self.__queue.append(frame)
+
+    def __get_decode_buffer(self, data, colorspace):
+
+        """
+        Returns a free output buffer from internal pool for decoding given JPEG data.
+
+        Parameters:
+            data (bytes): JPEG encoded frame data.
+            colorspace (str): colorspace of decoded frame.
+
+        **Returns:** A 1-dimensional numpy array.
+        """
+        # calculate required buffer size for decoded frame
+        height, width, _, _ = simplejpeg.decode_jpeg_header(data)
+        channels = 1 if colorspace == "GRAY" else (3 if len(colorspace) == 3 else 4)
+        return get_reusable_buffer(self.__decode_pool, (height * width * channels,))
+
+    def __wait_for_message(self, timeout):
+
+        """
+        Busy-polls the messaging socket briefly, before blocking on the poller until a message arrives, or
+        the connection is terminated.
+
+        Parameters:
+            timeout (int): poller timeout in milliseconds.
+
+        **Returns:** A boolean value, confirming whether a message is ready to be received.
+        """
+        # spin for a few iterations to catch already arrived or imminent message
+        for _ in range(100):
+            if self.__msg_socket.get(zmq.EVENTS) & zmq.POLLIN:
+                return True
+        # otherwise block on the poller
+        return self.__poll_socket(timeout)
+
+    def __poll_socket(self, timeout):
+
+        """
+        Polls the messaging socket until a message arrives, or the connection is terminated.
+
+        Parameters:
+            timeout (int): poller timeout in milliseconds.
+
+        **Returns:** A boolean value, confirming whether a message is ready to be received.
+        """
+        # poll the socket in short slices until message arrives or timeout,
+        # so that termination is noticed without waiting for whole timeout
+        while timeout > 0 and not self.__terminate:
+            socks = dict(self.__poll.poll(min(timeout, 100)))
+            if socks.get(self.__msg_socket) == zmq.POLLIN:
+                return True
+            timeout -= 100
+        return False
 
     def recv(self, return_data=None):
         """
@@ -1213,7 +1372,7 @@ def send(self, frame, message=None):
         A Server end method, that sends the data and frames over the network to Client(s).
 
         Parameters:
-            frame (numpy.ndarray): inputs numpy array(frame).
+            frame (numpy.ndarray/list): inputs numpy array(frame), or a list of frames to be sent together as a single batch.
             message (any): input for sending additional data _(of any datatype except `numpy.ndarray`)_ to Client(s).
 
         **Returns:** Data _(of any datatype)_ in selected exclusive modes, otherwise None-type.
@@ -1235,34 +1394,63 @@ def send(self, frame, message=None):
             )
             message = None
 
+        # handle batch of frames
+        batch = isinstance(frame, (list, tuple))
+        if batch and not frame:
+            logger.warning("Skipped empty batch of frames!")
+            return None
+
+        # check for invalid frame(s) in batch
+        if batch and any(x is None for x in frame):
+            raise ValueError(
+                "[NetGear:ERROR] :: Batch of frames cannot contain `None` frame(s)!"
+            )
+
         # define exit_flag and assign value
         exit_flag = True if (frame is None or self.__terminate) else False
 
-        # check whether exit_flag is False
-        if not (exit_flag) and not (frame.flags["C_CONTIGUOUS"]):
-            # check whether the incoming frame is contiguous
-            frame = np.ascontiguousarray(frame, dtype=frame.dtype)
-
-        # handle JPEG compression encoding
-        if self.__jpeg_compression:
-            if self.__jpeg_compression_colorspace == "GRAY":
-                if frame.ndim == 2:
-                    # patch for https://gitlab.com/jfolz/simplejpeg/-/issues/11
-                    frame = np.expand_dims(frame, axis=2)
-                frame = simplejpeg.encode_jpeg(
-                    frame,
-                    quality=self.__jpeg_compression_quality,
-                    colorspace=self.__jpeg_compression_colorspace,
-                    fastdct=self.__jpeg_compression_fastdct,
-                )
-            else:
-                frame = simplejpeg.encode_jpeg(
-                    frame,
-                    quality=self.__jpeg_compression_quality,
-                    colorspace=self.__jpeg_compression_colorspace,
-                    colorsubsampling="422",
-                    fastdct=self.__jpeg_compression_fastdct,
-                )
+        # prepare frame(s) for sending
+        msg_frames = []
+        if exit_flag:
+            # no frame(s) to send with termination signal
+            msg_dtypes = msg_shapes = [""]
+        else:
+            frames = frame if batch else [frame]
+            for item in frames:
+                # check whether the incoming frame is contiguous
+                if not (item.flags["C_CONTIGUOUS"]):
+                    item = np.ascontiguousarray(item, dtype=item.dtype)
+
+                # handle JPEG compression encoding
+                if self.__jpeg_compression:
+                    if self.__jpeg_compression_colorspace == "GRAY":
+                        if item.ndim == 2:
+                            # patch for https://gitlab.com/jfolz/simplejpeg/-/issues/11
+                            item = np.expand_dims(item, axis=2)
+                        item = simplejpeg.encode_jpeg(
+                            item,
+                            quality=self.__jpeg_compression_quality,
+                            colorspace=self.__jpeg_compression_colorspace,
+                            fastdct=self.__jpeg_compression_fastdct,
+                        )
+                    else:
+                        item = simplejpeg.encode_jpeg(
+                            item,
+                            quality=self.__jpeg_compression_quality,
+                            colorspace=self.__jpeg_compression_colorspace,
+                            colorsubsampling=self.__jpeg_compression_colorsubsampling,
+                            fastdct=self.__jpeg_compression_fastdct,
+                        )
+                msg_frames.append(item)
+
+            # define frame(s) datatype and shape
+            msg_dtypes = [
+                str(x.dtype) if not (self.__jpeg_compression) else ""
+                for x in msg_frames
+            ]
+            msg_shapes = [
+                x.shape if not (self.__jpeg_compression) else "" for x in msg_frames
+            ]
 
         # check if multiserver_mode is activated and assign values with unique port
         msg_dict = dict(port=self.__port) if self.__multiserver_mode else dict()
@@ -1280,17 +1468,25 @@ def send(self, frame, message=None):
                 else False,
                 message=message,
                 pattern=str(self.__pattern),
-                dtype=str(frame.dtype) if not (self.__jpeg_compression) else "",
-                shape=frame.shape if not (self.__jpeg_compression) else "",
+                batch=batch,
+                dtype=msg_dtypes if batch else msg_dtypes[0],
+                shape=msg_shapes if batch else msg_shapes[0],
             )
         )
 
-        # send the json dict
-        self.__msg_socket.send_json(msg_dict, self.__msg_flag | zmq.SNDMORE)
-        # send the frame array with correct flags
-        self.__msg_socket.send(
-            frame, flags=self.__msg_flag, copy=self.__msg_copy, track=self.__msg_track
-        )
+        if exit_flag:
+            # send only the json dict with termination signal
+            self.__msg_socket.send_json(msg_dict, self.__msg_flag)
+        else:
+            # send the json dict
+            self.__msg_socket.send_json(msg_dict, self.__msg_flag | zmq.SNDMORE)
+            # send all frame array(s) at once with correct flags
+            self.__msg_socket.send_multipart(
+                msg_frames,
+                flags=self.__msg_flag,
+                copy=self.__msg_copy,
+                track=self.__msg_track,
+            )
 
         # check if synchronous patterns, then wait for confirmation
         if self.__pattern < 2:
@@ -1300,8 +1496,7 @@ def send(self, frame, message=None):
                 # handles return data
                 recvd_data = None
 
-                socks = dict(self.__poll.poll(self.__request_timeout))
-                if socks.get(self.__msg_socket) == zmq.POLLIN:
+                if self.__wait_for_message(self.__request_timeout):
                     # handle return data
                     recv_json = self.__msg_socket.recv_json(flags=self.__msg_flag)
                 else:
@@ -1327,7 +1522,7 @@ def send(self, frame, message=None):
                         )
 
                     # Create new connection
-                    self.__msg_socket = self.__msg_context.socket(self.__msg_pattern)
+                    self.__msg_socket = self.__create_socket(self.__msg_pattern)
                     if isinstance(self.__connection_address, list):
                         for _connection in self.__connection_address:
                             self.__msg_socket.connect(_connection)
@@ -1405,8 +1600,7 @@ def send(self, frame, message=None):
                 )
             else:
                 # otherwise log normally
-                socks = dict(self.__poll.poll(self.__request_timeout))
-                if socks.get(self.__msg_socket) == zmq.POLLIN:
+                if self.__wait_for_message(self.__request_timeout):
                     recv_confirmation = self.__msg_socket.recv()
                 else:
                     logger.critical("No response from Client, Reconnecting again...")
@@ -1424,7 +1618,7 @@ def send(self, frame, message=None):
                         )
 
                     # Create new connection
-                    self.__msg_socket = self.__msg_context.socket(self.__msg_pattern)
+                    self.__msg_socket = self.__create_socket(self.__msg_pattern)
                     # handle SSH tunneling if enabled
                     if self.__ssh_tunnel_mode:
                         # establish tunnel connection
@@ -1471,6 +1665,7 @@ def close(self):
             self.__logging and logger.debug("Terminating. Please wait...")
             # properly close the socket
             self.__msg_socket.close(linger=0)
+            self.__release_context()
             self.__logging and logger.debug("Terminated Successfully!")
 
         else:
@@ -1488,6 +1683,7 @@ def close(self):
                 except ZMQError:
                     pass
                 finally:
+                    self.__release_context()
                     # exit
                     return
 
@@ -1518,4 +1714,15 @@ def close(self):
                 # properly close the socket
                 self.__msg_socket.setsockopt(zmq.LINGER, 0)
                 self.__msg_socket.close()
+                self.__release_context()
                 self.__logging and logger.debug("Terminated Successfully!")
+
+    def __release_context(self):
+        """
+        Stops secure mode authenticator (if any), and terminates messaging context if it's a dedicated one.
+        """
+        if not (self.__z_auth is None):
+            self.__z_auth.stop()
+            self.__z_auth = None
+        if self.__io_threads:
+            self.__msg_context.term()
@@ -19,19 +19,24 @@
 """
 # import the necessary packages
 
+import itertools
 import os
 import platform
 import queue
+import time
 import cv2
 import numpy as np
 import pytest
 import random
+import shutil
 import logging as log
 import tempfile
+import zmq
+from threading import Event, Thread
 from zmq.error import ZMQError
 
 from vidgear.gears import NetGear, VideoGear
-from vidgear.gears.helper import logger_handler
+from vidgear.gears.helper import logger_handler, generate_auth_certificates
 
 # define test logger
 logger = log.getLogger("Test_netgear")
@@ -42,36 +47,158 @@
 # define machine os
 _windows = True if os.name == "nt" else False
 
+# use `ipc` transport for loopback tests, except on Windows
+_loopback_protocol = "tcp" if _windows else "ipc"
+
+# define Test Video path once
+_TEST_VIDEO_PATH = os.path.abspath(
+    "{}/Downloads/Test_videos/BigBuckBunny_4sec.mp4".format(tempfile.gettempdir())
+)
+
 
 def return_testvideo_path():
     """
     returns Test Video path
     """
-    path = "{}/Downloads/Test_videos/BigBuckBunny_4sec.mp4".format(
-        tempfile.gettempdir()
+    return _TEST_VIDEO_PATH
+
+
+def resend_until_received(server, client, frame, return_data=None, timeout=10):
+    """
+    keeps resending frame until client receives it or timeout occurs, since PUB/SUB
+    pattern drops frames until client's subscription reaches the server
+    """
+    received = []
+    receiver = Thread(
+        target=lambda: received.append(client.recv(return_data=return_data)),
+        daemon=True,
+    )
+    receiver.start()
+    deadline = time.time() + timeout
+    while receiver.is_alive() and time.time() < deadline:
+        server.send(frame)
+        receiver.join(timeout=0.01)
+    return received[0] if received else None
+
+
+def threaded_frames(path, maxsize=4):
+    """
+    yields frames of given video, decoded by a separate producer thread into a bounded
+    queue, so that decoding overlaps with sending
+    """
+    frames = queue.Queue(maxsize=maxsize)
+    terminate = Event()
+
+    def producer():
+        stream = cv2.VideoCapture(path)
+        while not terminate.is_set():
+            (grabbed, frame) = stream.read()
+            # put frame (or None at end of stream) as soon as queue has space
+            while not terminate.is_set():
+                try:
+                    frames.put(frame if grabbed else None, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if not grabbed:
+                break
+        stream.release()
+
+    thread = Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        while True:
+            frame = frames.get(timeout=10)
+            if frame is None:
+                break
+            yield frame
+    finally:
+        terminate.set()
+        thread.join()
+
+
+def return_port(port):
+    """
+    returns given port shifted by a unique offset for each pytest-xdist worker (if any)
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    if not worker:
+        return str(port)
+    return str(int(port) + (int(worker.lstrip("gw")) + 1) * 1000)
+
+
+def read_key_files(keys_dir):
+    """
+    returns contents of all key files within given directory, mapped to their paths
+    """
+    keys = {}
+    for root, _, names in os.walk(keys_dir):
+        for name in names:
+            with open(os.path.join(root, name), "rb") as key_file:
+                keys[os.path.join(root, name)] = key_file.read()
+    return keys
+
+
+@pytest.fixture(scope="module")
+def sample_frame():
+    """
+    decodes a random frame (between 10-100) of Test Video once, and returns it
+    """
+    stream = cv2.VideoCapture(return_testvideo_path())
+    frame = None
+    for _ in range(random.randint(10, 100)):
+        (grabbed, frame_next) = stream.read()
+        if not grabbed:
+            break
+        frame = frame_next
+    stream.release()
+    assert not (frame is None), "Failed to decode Test Video!"
+    return frame
+
+
+@pytest.fixture(scope="session")
+def zmq_ctx():
+    """
+    creates a single ZMQ context shared by NetGear instances across the session
+    """
+    ctx = zmq.Context(io_threads=2)
+    yield ctx
+    ctx.destroy(linger=0)
+
+
+@pytest.fixture(scope="session")
+def curve_certs(tmp_path_factory):
+    """
+    generates CURVE key-pairs once per session, and returns their `.vidgear` path
+    """
+    keys_dir, _, _ = generate_auth_certificates(
+        str(tmp_path_factory.mktemp("certs")), overwrite=True
     )
-    return os.path.abspath(path)
+    return os.path.dirname(keys_dir)
 
 
-@pytest.mark.parametrize("address, port", [("172.31.11.15.77", "5555"), (None, "5555")])
-def test_playback(address, port):
+@pytest.mark.parametrize(
+    "address, port",
+    [("172.31.11.15.77", 5555), (None, 5555)],
+)
+def test_playback(address, port, zmq_ctx):
     """
     Tests NetGear Bare-minimum network playback capabilities
     """
-    stream = None
+    # define parameters
+    port = return_port(port)
+    options = {"copy": False, "track": False, "socket_buffer_size": 4 << 20}
+    # initialize
     server = None
     client = None
     try:
-        # open stream
-        stream = cv2.VideoCapture(return_testvideo_path())
         # open server and client with default params
-        client = NetGear(address=address, port=port, receive_mode=True)
-        server = NetGear(address=address, port=port)
-        # playback
-        while True:
-            (grabbed, frame_server) = stream.read()
-            if not grabbed:
-                break
+        client = NetGear(
+            context=zmq_ctx, address=address, port=port, receive_mode=True, **options
+        )
+        server = NetGear(context=zmq_ctx, address=address, port=port, **options)
+        # playback, while frames are decoded in separate thread
+        for frame_server in threaded_frames(return_testvideo_path()):
             server.send(frame_server)  # send
             frame_client = client.recv()  # recv
     except Exception as e:
@@ -84,19 +211,134 @@ def test_playback(address, port):
             pytest.fail(str(e))
     finally:
         # clean resources
-        if not (stream is None):
-            stream.release()
         if not (server is None):
             server.close()
         if not (client is None):
             client.close()
 
 
+@pytest.mark.parametrize("jpeg_compression", [False, True])
+def test_batch_playback(jpeg_compression, zmq_ctx):
+    """
+    Tests NetGear network playback with batches of frames
+    """
+    # define parameters
+    options = {"copy": False, "track": False, "jpeg_compression": jpeg_compression}
+    # initialize
+    server = None
+    client = None
+    try:
+        # open server and client
+        client = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            receive_mode=True,
+            **options
+        )
+        server = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            **options
+        )
+        # playback in batches of 8 frames, while frames are decoded in separate thread
+        frames = threaded_frames(return_testvideo_path())
+        while True:
+            batch = list(itertools.islice(frames, 8))
+            if not batch:
+                break
+            server.send(batch)  # send
+            for frame_server in batch:
+                frame_client = client.recv()  # recv
+                # check if received frame exactly matches input frame
+                if not (jpeg_compression):
+                    assert np.array_equal(frame_server, frame_client)
+                else:
+                    assert frame_client.shape == frame_server.shape
+    except Exception as e:
+        pytest.fail(str(e))
+    finally:
+        # clean resources
+        if not (server is None):
+            server.close()
+        if not (client is None):
+            client.close()
+
+
+@pytest.mark.parametrize("jpeg_compression", [False, True])
+def test_batch_invalid_frames(jpeg_compression, sample_frame, zmq_ctx):
+    """
+    Tests NetGear rejects batches of frames containing `None` frame(s)
+    """
+    server = None
+    try:
+        # open server
+        server = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            jpeg_compression=jpeg_compression,
+        )
+        # send invalid batch
+        with pytest.raises(ValueError):
+            server.send([sample_frame, None])
+    finally:
+        # clean resources
+        if not (server is None):
+            server.close()
+
+
+@pytest.mark.parametrize("io_threads", [2, 0])
+def test_io_threads(io_threads, sample_frame):
+    """
+    Tests NetGear with dedicated messaging context of multiple I/O threads
+    """
+    # define parameters
+    options = {"jpeg_compression": False, "io_threads": io_threads}
+    # initialize
+    server = None
+    client = None
+    try:
+        # open server and client
+        client = NetGear(
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            receive_mode=True,
+            **options
+        )
+        server = NetGear(protocol=_loopback_protocol, port=return_port(5555), **options)
+        # check if dedicated context is used only for valid value
+        contexts = [conn._NetGear__msg_context for conn in (server, client)]
+        for ctx in contexts:
+            if io_threads > 0:
+                assert not (ctx is zmq.Context.instance())
+                assert ctx.get(zmq.IO_THREADS) == io_threads
+            else:
+                assert ctx is zmq.Context.instance()
+        # send frame over network
+        server.send(sample_frame)
+        frame_client = client.recv()
+        # check if received frame exactly matches input frame
+        assert np.array_equal(sample_frame, frame_client)
+    finally:
+        # clean resources
+        if not (server is None):
+            server.close()
+        if not (client is None):
+            client.close()
+    # check if only dedicated contexts are terminated on close
+    assert all(ctx.closed == (io_threads > 0) for ctx in contexts)
+
+
 @pytest.mark.parametrize("receive_mode", [True, False])
-def test_primary_mode(receive_mode):
+def test_primary_mode(receive_mode, zmq_ctx):
     """
     Tests NetGear Bare-minimum network playback capabilities
     """
+    # define parameters
+    options = {"copy": False, "track": False}
+    # initialize
     stream = None
     conn = None
     try:
@@ -105,7 +347,12 @@ def test_primary_mode(receive_mode):
         stream = VideoGear(source=return_testvideo_path(), **options_gear).start()
         frame = stream.read()
         # open server and client with default params
-        conn = NetGear(receive_mode=receive_mode)
+        conn = NetGear(
+            context=zmq_ctx,
+            port=return_port(5555),
+            receive_mode=receive_mode,
+            **options
+        )
         if receive_mode:
             conn.send(frame)
         else:
@@ -128,7 +375,7 @@ def test_primary_mode(receive_mode):
 @pytest.mark.parametrize(
     "pattern", [2, 3]
 )  # 2:(zmq.PUB,zmq.SUB) (#3 is incorrect value)
-def test_patterns(pattern):
+def test_patterns(pattern, sample_frame, zmq_ctx):
     """
     Testing NetGear different messaging patterns
     """
@@ -136,25 +383,38 @@ def test_patterns(pattern):
     options = {"flag": 0, "copy": False, "track": False, "jpeg_compression": False}
     # initialize
     frame_server = None
-    stream = None
     server = None
     client = None
     try:
-        # open stream
-        stream = cv2.VideoCapture(return_testvideo_path())
-        client = NetGear(pattern=pattern, receive_mode=True, logging=True, **options)
-        server = NetGear(pattern=pattern, logging=True, **options)
-        # select random input frame from stream
-        i = 0
-        random_cutoff = random.randint(10, 100)
-        while i < random_cutoff:
-            (grabbed, frame_server) = stream.read()
-            i += 1
+        client = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
+        )
+        server = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=pattern,
+            logging=True,
+            **options
+        )
+        # use random frame decoded from Test Video
+        frame_server = sample_frame
         # check if input frame is valid
         assert not (frame_server is None)
         # send frame over network
-        server.send(frame_server)
-        frame_client = client.recv(return_data=[1, 2, 3] if pattern == 2 else None)
+        if pattern == 2:
+            frame_client = resend_until_received(
+                server, client, frame_server, return_data=[1, 2, 3]
+            )
+        else:
+            server.send(frame_server)
+            frame_client = client.recv()
         # check if received frame exactly matches input frame
         assert np.array_equal(frame_server, frame_client)
     except Exception as e:
@@ -164,8 +424,6 @@ def test_patterns(pattern):
             pytest.fail(str(e))
     finally:
         # clean resources
-        if not (stream is None):
-            stream.release()
         if not (server is None):
             server.close()
         if not (client is None):
@@ -178,6 +436,7 @@ def test_patterns(pattern):
         {
             "jpeg_compression": "invalid",
             "jpeg_compression_quality": 5,
+            "jpeg_compression_colorsubsampling": "invalid",
         },
         {
             "jpeg_compression": " gray  ",
@@ -190,10 +449,12 @@ def test_patterns(pattern):
             "jpeg_compression_quality": 55.55,
             "jpeg_compression_fastdct": True,
             "jpeg_compression_fastupsample": True,
+            "jpeg_compression_colorsubsampling": "420",
         },
+        {"jpeg_compression": False},
     ],
 )
-def test_compression(options_server):
+def test_compression(options_server, zmq_ctx):
     """
     Testing NetGear's real-time frame compression capabilities
     """
@@ -213,8 +474,23 @@ def test_compression(options_server):
         stream = VideoGear(
             source=return_testvideo_path(), colorspace=colorspace, **options_gear
         ).start()
-        client = NetGear(pattern=0, receive_mode=True, logging=True)
-        server = NetGear(pattern=0, logging=True, **options_server)
+        client = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=0,
+            receive_mode=True,
+            logging=True,
+            jpeg_compression=options_server["jpeg_compression"],
+        )
+        server = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=0,
+            logging=True,
+            **options_server
+        )
         # send over network
         while True:
             frame_server = stream.read()
@@ -229,6 +505,9 @@ def test_compression(options_server):
                 assert (
                     frame_server.ndim == frame_client.ndim
                 ), "Grayscale frame Test Failed!"
+            elif options_server["jpeg_compression"] is False:
+                # check if uncompressed frame exactly matches input frame
+                assert np.array_equal(frame_server, frame_client)
     except Exception as e:
         if isinstance(e, (ZMQError, ValueError, RuntimeError, queue.Empty)):
             logger.exception(str(e))
@@ -246,6 +525,7 @@ def test_compression(options_server):
 
 test_data_class = [
     (0, 1, tempfile.gettempdir(), True),
+    (0, 1, "cached", False),
     (0, 1, ["invalid"], True),
     (
         1,
@@ -261,32 +541,64 @@ def test_compression(options_server):
 @pytest.mark.parametrize(
     "pattern, security_mech, custom_cert_location, overwrite_cert", test_data_class
 )
-def test_secure_mode(pattern, security_mech, custom_cert_location, overwrite_cert):
+def test_secure_mode(
+    pattern,
+    security_mech,
+    custom_cert_location,
+    overwrite_cert,
+    sample_frame,
+    curve_certs,
+    tmp_path,
+):
     """
     Testing NetGear's Secure Mode
     """
+    # copy cached key-pairs instead of generating new ones
+    cached = custom_cert_location == "cached"
+    if cached:
+        keys_dir = os.path.join(str(tmp_path), ".vidgear")
+        shutil.copytree(curve_certs, keys_dir)
+        custom_cert_location = str(tmp_path)
+        # save copied key-pairs to check they are reused as it is
+        cached_keys = read_key_files(keys_dir)
     # define security mechanism
     options = {
         "secure_mode": security_mech,
         "custom_cert_location": custom_cert_location,
         "overwrite_cert": overwrite_cert,
+        "jpeg_compression": False,
     }
+    # use separate contexts, since each end starts its own authenticator
+    server_ctx = zmq.Context()
+    client_ctx = zmq.Context()
     # initialize
     frame_server = None
-    stream = None
     server = None
     client = None
     try:
-        # open stream
-        stream = cv2.VideoCapture(return_testvideo_path())
         # define params
-        server = NetGear(pattern=pattern, logging=True, **options)
-        client = NetGear(pattern=pattern, receive_mode=True, logging=True, **options)
-        # select random input frame from stream
-        i = 0
-        while i < random.randint(10, 100):
-            (grabbed, frame_server) = stream.read()
-            i += 1
+        server = NetGear(
+            context=server_ctx,
+            address="127.0.0.1",
+            port=return_port(5555),
+            pattern=pattern,
+            logging=True,
+            **options
+        )
+        # check if cached key-pairs were not regenerated
+        if cached:
+            assert read_key_files(keys_dir) == cached_keys, "Cached keys regenerated!"
+        client = NetGear(
+            context=client_ctx,
+            address="127.0.0.1",
+            port=return_port(5555),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
+        )
+        # use random frame decoded from Test Video
+        frame_server = sample_frame
         # check input frame is valid
         assert not (frame_server is None)
         # send and recv input frame
@@ -295,18 +607,20 @@ def test_secure_mode(pattern, security_mech, custom_cert_location, overwrite_cer
         # check if received frame exactly matches input frame
         assert np.array_equal(frame_server, frame_client)
     except Exception as e:
-        if isinstance(e, (ZMQError, ValueError, RuntimeError, AssertionError)):
+        if not (cached) and isinstance(
+            e, (ZMQError, ValueError, RuntimeError, AssertionError)
+        ):
             pytest.xfail(str(e))
         else:
             pytest.fail(str(e))
     finally:
         # clean resources
-        if not (stream is None):
-            stream.release()
         if not (server is None):
             server.close()
         if not (client is None):
             client.close()
+        server_ctx.destroy(linger=0)
+        client_ctx.destroy(linger=0)
 
 
 @pytest.mark.parametrize(
@@ -318,6 +632,8 @@ def test_secure_mode(pattern, security_mech, custom_cert_location, overwrite_cer
             {
                 "bidirectional_mode": True,
                 "jpeg_compression": ["invalid"],
+                "copy": False,
+                "track": False,
             },
         ),
         (
@@ -332,24 +648,33 @@ def test_secure_mode(pattern, security_mech, custom_cert_location, overwrite_cer
                 "jpeg_compression_quality": 55,
                 "jpeg_compression_fastdct": False,
                 "jpeg_compression_fastupsample": False,
+                "copy": False,
+                "track": False,
             },
         ),
         (
             1,
-            (np.random.random(size=(480, 640, 3)) * 255).astype(np.uint8),
-            {"bidirectional_mode": True, "jpeg_compression": "GRAY"},
+            np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8),
+            {
+                "bidirectional_mode": True,
+                "jpeg_compression": "GRAY",
+                "copy": False,
+                "track": False,
+            },
         ),
         (
             2,
-            (np.random.random(size=(480, 640, 3)) * 255).astype(np.uint8),
+            np.random.randint(0, 256, size=(480, 640, 3), dtype=np.uint8),
             {
                 "bidirectional_mode": True,
                 "jpeg_compression": True,
+                "copy": False,
+                "track": False,
             },
         ),
     ],
 )
-def test_bidirectional_mode(pattern, target_data, options):
+def test_bidirectional_mode(pattern, target_data, options, zmq_ctx):
     """
     Testing NetGear's Bidirectional Mode with different data-types
     """
@@ -379,8 +704,23 @@ def test_bidirectional_mode(pattern, target_data, options):
             source=return_testvideo_path(), colorspace=colorspace, **options_gear
         ).start()
         # define params
-        client = NetGear(pattern=pattern, receive_mode=True, logging=True, **options)
-        server = NetGear(pattern=pattern, logging=True, **options)
+        client = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
+        )
+        server = NetGear(
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5555),
+            pattern=pattern,
+            logging=True,
+            **options
+        )
         # check if target data is numpy ndarray
         if isinstance(target_data, np.ndarray):
             # sent frame and data from server to client
@@ -432,6 +772,8 @@ def test_bidirectional_mode(pattern, target_data, options):
                 "jpeg_compression": False,
                 "multiserver_mode": True,
                 "multiclient_mode": True,
+                "copy": False,
+                "track": False,
             },
         ),
         (
@@ -440,6 +782,8 @@ def test_bidirectional_mode(pattern, target_data, options):
                 "jpeg_compression": False,
                 "multiserver_mode": True,
                 "multiclient_mode": True,
+                "copy": False,
+                "track": False,
             },
         ),
         (
@@ -448,6 +792,8 @@ def test_bidirectional_mode(pattern, target_data, options):
                 "jpeg_compression": False,
                 "multiserver_mode": True,
                 "bidirectional_mode": True,
+                "copy": False,
+                "track": False,
             },
         ),
         (
@@ -455,17 +801,18 @@ def test_bidirectional_mode(pattern, target_data, options):
             {
                 "multiserver_mode": True,
                 "ssh_tunnel_mode": "new@sdf.org",
+                "copy": False,
+                "track": False,
             },
         ),
     ],
 )
-def test_multiserver_mode(pattern, options):
+def test_multiserver_mode(pattern, options, sample_frame, zmq_ctx):
     """
     Testing NetGear's Multi-Server Mode with three unique servers
     """
     # initialize
     frame_server = None
-    stream = None
     server_1 = None
     server_2 = None
     server_3 = None
@@ -473,11 +820,11 @@ def test_multiserver_mode(pattern, options):
     # define client-end dict to save frames in-accordance with unique port
     client_frame_dict = {}
     try:
-        # open stream
-        stream = cv2.VideoCapture(return_testvideo_path())
         # define a single client
         client = NetGear(
-            port=["5556", "5557", "5558"],
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=[return_port(5556), return_port(5557), return_port(5558)],
             pattern=pattern,
             receive_mode=True,
             logging=True,
@@ -485,18 +832,31 @@ def test_multiserver_mode(pattern, options):
         )
         # define three unique server
         server_1 = NetGear(
-            pattern=pattern, port="5556", logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            pattern=pattern,
+            port=return_port(5556),
+            logging=True,
+            **options
         )  # at port `5556`
         server_2 = NetGear(
-            pattern=pattern, port="5557", logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            pattern=pattern,
+            port=return_port(5557),
+            logging=True,
+            **options
         )  # at port `5557`
         server_3 = NetGear(
-            pattern=pattern, port="5558", logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            pattern=pattern,
+            port=return_port(5558),
+            logging=True,
+            **options
         )  # at port `5558`
-        i = 0
-        while i < random.randint(10, 100):
-            (grabbed, frame_server) = stream.read()
-            i += 1
+        # use random frame decoded from Test Video
+        frame_server = sample_frame
         # check if input frame is valid
         assert not (frame_server is None)
 
@@ -524,8 +884,6 @@ def test_multiserver_mode(pattern, options):
             pytest.fail(str(e))
     finally:
         # clean resources
-        if not (stream is None):
-            stream.release()
         if not (server_1 is None):
             server_1.close()
         if not (server_2 is None):
@@ -537,7 +895,7 @@ def test_multiserver_mode(pattern, options):
 
 
 @pytest.mark.parametrize("pattern", [0, 1])
-def test_multiclient_mode(pattern):
+def test_multiclient_mode(pattern, zmq_ctx):
     """
     Testing NetGear's Multi-Client Mode with three unique clients
     """
@@ -546,6 +904,8 @@ def test_multiclient_mode(pattern):
         "multiclient_mode": True,
         "bidirectional_mode": True,
         "jpeg_compression": False,
+        "copy": False,
+        "track": False,
     }  # bidirectional_mode is activated for testing only
 
     # initialize
@@ -561,20 +921,44 @@ def test_multiclient_mode(pattern):
         stream = VideoGear(source=return_testvideo_path(), **options_gear).start()
         # define single server
         server = NetGear(
-            pattern=pattern, port=["5556", "5557", "5558"], logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            pattern=pattern,
+            port=[return_port(5556), return_port(5557), return_port(5558)],
+            logging=True,
+            **options
         )
         # define a three unique clients
         client_1 = NetGear(
-            port="5556", pattern=pattern, receive_mode=True, logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5556),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
         )
         client_2 = NetGear(
-            port="5557", pattern=pattern, receive_mode=True, logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5557),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
         )
         client_3 = NetGear(
-            port="5558", pattern=pattern, receive_mode=True, logging=True, **options
+            context=zmq_ctx,
+            protocol=_loopback_protocol,
+            port=return_port(5558),
+            pattern=pattern,
+            receive_mode=True,
+            logging=True,
+            **options
         )
         i = 0
-        while i < random.randint(10, 100):
+        random_cutoff = random.randint(10, 100)
+        while i < random_cutoff:
             frame_client = stream.read()
             i += 1
         # check if input frame is valid
@@ -628,7 +1012,7 @@ def test_multiclient_mode(pattern):
         {"max_retries": 2, "request_timeout": -1, "multiserver_mode": True},
     ],
 )
-def test_client_reliablity(options):
+def test_client_reliablity(options, zmq_ctx):
     """
     Testing validation function of NetGear API
     """
@@ -637,8 +1021,11 @@ def test_client_reliablity(options):
     try:
         # define params
         client = NetGear(
+            context=zmq_ctx,
             pattern=1,
-            port=[5587] if "multiserver_mode" in options.keys() else 6657,
+            port=[return_port(5587)]
+            if "multiserver_mode" in options.keys()
+            else return_port(6657),
             receive_mode=True,
             logging=True,
             **options
@@ -684,27 +1071,25 @@ def test_client_reliablity(options):
         },
     ],
 )
-def test_server_reliablity(options):
+def test_server_reliablity(options, sample_frame):
     """
     Testing validation function of NetGear API
     """
     server = None
-    stream = None
     frame_client = None
     try:
         # define params
         server = NetGear(
             address="127.0.0.1" if "ssh_tunnel_mode" in options else None,
             pattern=1,
-            port=[5585] if "multiclient_mode" in options.keys() else 6654,
+            port=[return_port(5585)]
+            if "multiclient_mode" in options.keys()
+            else return_port(6654),
             logging=True,
             **options
         )
-        stream = cv2.VideoCapture(return_testvideo_path())
-        i = 0
-        while i < random.randint(10, 100):
-            (grabbed, frame_client) = stream.read()
-            i += 1
+        # use random frame decoded from Test Video
+        frame_client = sample_frame
         # check if input frame is valid
         assert not (frame_client is None)
         # send frame without connection
@@ -717,8 +1102,6 @@ def test_server_reliablity(options):
             logger.exception(str(e))
     finally:
         # clean resources
-        if not (stream is None):
-            stream.release()
         if not (server is None):
             server.close()
 
@@ -28,6 +28,7 @@
 import platform
 import requests
 import tempfile
+from collections import deque
 from os.path import expanduser
 from mpegdash.parser import MPEGDASHParser
 
@@ -54,6 +55,7 @@
     get_supported_resolution,
     dimensions_to_resolutions,
     retrieve_best_interpolation,
+    get_reusable_buffer,
 )
 from vidgear.gears.asyncio.helper import generate_webdata, validate_webdata
 
@@ -578,3 +580,22 @@ def test_delete_file_safe():
         delete_file_safe(os.path.join(expanduser("~"), "invalid"))
     except Exception as e:
         pytest.fail(str(e))
+
+
+def test_get_reusable_buffer():
+    """
+    Testing get_reusable_buffer method
+    """
+    pool = deque(maxlen=2)
+    # allocate new buffer, and keep its view in use
+    view = get_reusable_buffer(pool, (10, 10, 3))[:, :, 0]
+    assert len(pool) == 1
+    # buffer in use must not be reused
+    buffer = get_reusable_buffer(pool, (10, 10, 3))
+    assert not (np.shares_memory(buffer, view)) and len(pool) == 2
+    # free buffer must be reused
+    del view
+    assert get_reusable_buffer(pool, (10, 10, 3)) is pool[0]
+    # buffer of different layout must not be reused
+    gray = get_reusable_buffer(pool, (10, 10))
+    assert gray.shape == (10, 10) and gray is pool[-1]